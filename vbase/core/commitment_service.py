@@ -4,7 +4,7 @@ such as blockchain-based smart contracts.
 """
 
 import logging
-from typing import List, Union
+from typing import Iterable, List, Union
 from abc import ABC, abstractmethod
 
 from vbase.utils.log import get_default_logger
@@ -77,6 +77,17 @@ class CommitmentService(ABC):
         :return: The pandas timestamp in string representation.
         """
 
+    @staticmethod
+    @abstractmethod
+    def convert_timestamps_chain_to_str(ts_list: Iterable[int]) -> List[str]:
+        """
+        Convert chain timestamps returned by smart contract calls to Pandas timestamps.
+        Vectorized version of convert_timestamp_chain_to_str().
+
+        :param ts_list: The chain timestamps returned by smart contract calls.
+        :return: The pandas timestamps in string representation.
+        """
+
     @abstractmethod
     def get_named_set_cid(self, name: str) -> str:
         """
@@ -148,6 +159,21 @@ class CommitmentService(ABC):
             False otherwise.
         """
 
+    @abstractmethod
+    def verify_user_objects_batch(
+        self, user: str, object_cids: List[str], timestamps: List[str]
+    ) -> List[bool]:
+        """
+        Verifies a batch of object commitments previously recorded.
+        This is a low-level function that operates on object hashes.
+
+        :param user: The address for the user who recorded the commitments.
+        :param object_cids: The CIDs identifying the objects.
+        :param timestamps: The timestamps of the commitments.
+        :return: A list with True for each commitment that has been verified
+            successfully and False otherwise.
+        """
+
     @abstractmethod
     def add_set_object(self, set_cid: str, object_cid: str) -> dict:
         """
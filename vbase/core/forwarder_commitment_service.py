@@ -432,6 +432,27 @@ class ForwarderCommitmentService(Web3CommitmentService):
         )
         return bool(int(ret, base=16))
 
+    def verify_user_objects_batch(
+        self, user: str, object_cids: List[str], timestamps: List[str]
+    ) -> List[bool]:
+        user = self.w3.to_checksum_address(user)
+        function_data = self.csc.encode_abi(
+            fn_name="verifyUserObjectsBatch",
+            args=[
+                user,
+                object_cids,
+                [self.convert_timestamp_str_to_chain(ts) for ts in timestamps],
+            ],
+        )
+        ret = self._call_forwarder_api(
+            api="call",
+            params={
+                "data": function_data,
+            },
+        )
+        # Decode the ABI-encoded bool[] return value.
+        return list(self.w3.codec.decode(["bool[]"], hex_str_to_bytes(ret))[0])
+
     def add_set_object(self, set_cid: str, object_cid: str) -> dict:
         _LOG.debug("Sending transaction to addSetObject")
         receipt = self._post_execute(
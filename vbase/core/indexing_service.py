@@ -353,25 +353,30 @@ class Web3HTTPIndexingService(IndexingService):
     ) -> List[dict]:
         # Join the object and set object commitments.
         # Join receipts and set_receipts on (chainId, transactionHash, objectCid).
-        # This is a simple O(n^2) join.
-        # We could use a more efficient join by pre-sorting.
-        # If this becomes a performance bottleneck, we will have to optimize.
-        # This should not be necessary as the runtime should be dominated
-        # by node RPC calls above.
+        # Index set_receipts by the join key once so that each lookup is O(1)
+        # rather than a scan of set_receipts for every receipt.
+        # TODO: Consider a single tx with multiple (objectCid, setCid) commitments.
+        # This is not expected in the normal course of operation, but may change.
+        # Strictly speaking, consecutive events can be thus joined
+        # since they are emitted by a single addSetObject() call.
+        # We can handle this with an index for multiple (objectCid, setCid) commitments.
+        set_cids = {}
+        for set_receipt in set_receipts:
+            # Keep the first matching set receipt for each key.
+            set_cids.setdefault(
+                (
+                    set_receipt["chainId"],
+                    set_receipt["transactionHash"],
+                    set_receipt["objectCid"],
+                ),
+                set_receipt["setCid"],
+            )
         for receipt in receipts:
-            for set_receipt in set_receipts:
-                # TODO: Consider a single tx with multiple (objectCid, setCid) commitments.
-                # This is not expected in the normal course of operation, but may change.
-                # Strictly speaking, consecutive events can be thus joined
-                # since they are emitted by a single addSetObject() call.
-                # We can handle this with an index for multiple (objectCid, setCid) commitments.
-                if (
-                    receipt["chainId"] == set_receipt["chainId"]
-                    and receipt["transactionHash"] == set_receipt["transactionHash"]
-                    and receipt["objectCid"] == set_receipt["objectCid"]
-                ):
-                    receipt["setCid"] = set_receipt["setCid"]
-                    break
+            set_cid = set_cids.get(
+                (receipt["chainId"], receipt["transactionHash"], receipt["objectCid"])
+            )
+            if set_cid is not None:
+                receipt["setCid"] = set_cid
 
         return receipts
 
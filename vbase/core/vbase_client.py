@@ -6,6 +6,7 @@ import logging
 import os
 from typing import Callable, List, Union
 from dotenv import load_dotenv
+import numpy as np
 import pandas as pd
 
 from vbase.utils.log import get_default_logger
@@ -14,7 +15,7 @@ from vbase.core.web3_http_commitment_service import Web3HTTPCommitmentService
 from vbase.core.web3_http_commitment_service_test import Web3HTTPCommitmentServiceTest
 from vbase.core.forwarder_commitment_service import ForwarderCommitmentService
 from vbase.core.forwarder_commitment_service_test import ForwarderCommitmentServiceTest
-from vbase.utils.crypto_utils import add_uint256_uint256
+from vbase.utils.crypto_utils import add_int_uint256
 
 
 LOG = get_default_logger(__name__)
@@ -184,7 +185,8 @@ class VBaseClient:
         :return: True if the names comprise all named sets committed by the user;
             False otherwise.
         """
-        user_sets_cid_sum = "0x0"
+        # Keep the running sum as an int and convert it to hex once.
+        user_sets_cid_sum = 0
         for name in names:
             set_cid = self.get_named_set_cid(name)
             # Add uint256s with overflow and wrap-around.
@@ -192,8 +194,8 @@ class VBaseClient:
             # unchecked {
             #    userSetCidSums[user] += uint256(setCid);
             # }
-            user_sets_cid_sum = add_uint256_uint256(user_sets_cid_sum, set_cid)
-        if not self.verify_user_sets(user, user_sets_cid_sum):
+            user_sets_cid_sum = add_int_uint256(user_sets_cid_sum, set_cid)
+        if not self.verify_user_sets(user, hex(user_sets_cid_sum)):
             return False
         return True
 
@@ -228,6 +230,27 @@ class VBaseClient:
         """
         return self.commitment_service.verify_user_object(user, object_cid, timestamp)
 
+    def verify_user_objects_batch(
+        self,
+        user: str,
+        object_cids: List[str],
+        timestamps: List[Union[pd.Timestamp, str]],
+    ) -> List[bool]:
+        """
+        Verifies a batch of object commitments previously recorded
+        using a single call to the commitment service.
+        This is a low-level function that operates on object hashes.
+
+        :param user: The address for the user who recorded the commitments.
+        :param object_cids: The CIDs identifying the objects.
+        :param timestamps: The timestamps of the commitments.
+        :return: A list with True for each commitment that has been verified
+            successfully and False otherwise.
+        """
+        return self.commitment_service.verify_user_objects_batch(
+            user, object_cids, timestamps
+        )
+
     def add_set_object(self, set_cid: str, object_cid: str) -> dict:
         """
         Records a commitment for an object belonging to a set of objects.
@@ -310,6 +333,7 @@ class VBaseClient:
         self,
         ts: pd.DatetimeIndex,
         callback: Callable[[], Union[int, float, dict, pd.DataFrame]],
+        dtype: Union[np.dtype, type, str, None] = None,
     ) -> Union[pd.Series, pd.DataFrame]:
         """
         Runs a point-in-time (PIT) simulation.
@@ -319,17 +343,25 @@ class VBaseClient:
         :param ts: Times/timestamps for which callback should be called
             and PIT world state simulated.
         :param callback: The callback to call.
+        :param dtype: The dtype of callback outputs, if known.
+            Numeric simulations may specify a numeric dtype, such as np.float64,
+            to collect outputs directly into a typed array.
+            If None, outputs are collected as objects and the dtype is inferred.
         :return: The aggregated output of all callback invocations.
         """
-        sim_records = []
+        # Pre-allocate the output buffer and fill it by index.
+        sim_records = np.empty(len(ts), dtype=object if dtype is None else dtype)
         self._in_sim = True
-        for t in ts:
+        for i, t in enumerate(ts):
             self._sim_t = t
             LOG.debug("run_pit_sim(): > callback for t = %s", t)
             ret = callback()
             LOG.debug("run_pit_sim(): < callback for t = %s", t)
             LOG.debug("run_pit_sim(): callback returned: %s", t)
-            sim_records.append(ret)
+            sim_records[i] = ret
         self._in_sim = False
         self._sim_t = None
+        if dtype is None:
+            # Infer the dtype as we would for a list of callback outputs.
+            return pd.Series(sim_records, index=ts).infer_objects()
         return pd.Series(sim_records, index=ts)
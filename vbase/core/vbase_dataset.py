@@ -7,7 +7,7 @@ from abc import ABC
 from enum import Enum
 import json
 import logging
-from typing import Any, List, Type, Union
+from typing import Any, List, Tuple, Type, Union
 import numpy as np
 import pandas as pd
 
@@ -18,6 +18,7 @@ from vbase.core.indexing_service import IndexingService
 from vbase.utils.crypto_utils import (
     add_int_uint256,
     hash_typed_values,
+    sum_uint256,
 )
 from vbase.utils.log import get_default_logger
 
@@ -160,6 +161,8 @@ class VBaseDataset(ABC):
         # pd.Timestamp is not serializable, so we save string representations of timestamps.
         self.timestamps: List[str] = []
         self.object_cid_sum: int = 0
+        # Cached hex string for object_cid_sum and the sum it was built for.
+        self._object_cid_sum_hex: Tuple[int, str] = (0, "0x0")
 
         # Process dataset access type.
         self.access: Union[_Access, None] = None
@@ -220,6 +223,22 @@ class VBaseDataset(ABC):
         """
         return json.dumps(self.to_dict())
 
+    @property
+    def object_cid_sum_hex(self) -> str:
+        """
+        Return the hex string representation of the object CID sum
+        used to verify set commitments.
+        The string is cached until the sum changes.
+
+        :return: The object CID sum as a hex string.
+        """
+        if self._object_cid_sum_hex[0] != self.object_cid_sum:
+            self._object_cid_sum_hex = (
+                self.object_cid_sum,
+                f"0x{self.object_cid_sum:x}",
+            )
+        return self._object_cid_sum_hex[1]
+
     @staticmethod
     def get_set_cid_for_dataset(dataset_name: str) -> str:
         """
@@ -265,6 +284,22 @@ class VBaseDataset(ABC):
         self._add_record_worker(record, object_cid, cl["timestamp"])
         return cl
 
+    def _build_records_batch(
+        self, record_data_list: List[any]
+    ) -> Tuple[List[VBaseObject], List[str]]:
+        """
+        Build records for a batch of records' data and calculate their CIDs.
+
+        :param record_data_list: The list of records' data.
+        :return: A tuple containing the records and their CIDs.
+        """
+        records = [self.record_type(record_data) for record_data in record_data_list]
+        object_cids = self.record_type.get_cids_for_data(record_data_list)
+        # Cache the CIDs on the records to avoid hashing them again.
+        for record, object_cid in zip(records, object_cids):
+            record.cid = object_cid
+        return records, object_cids
+
     def add_records_batch(self, record_data_list: List[any]) -> List[dict]:
         """
         Add a list of records to a VBaseDataset object.
@@ -278,8 +313,7 @@ class VBaseDataset(ABC):
         """
         assert self.access == _Access.WRITE
         # Build and submit commitment to get the timestamps.
-        records = [self.record_type(record_data) for record_data in record_data_list]
-        object_cids = [record.get_cid() for record in records]
+        records, object_cids = self._build_records_batch(record_data_list)
         cls = self.vbc.add_set_objects_batch(self.cid, object_cids)
         # Record the timestamps received from the commitment receipt.
         for i, record in enumerate(records):
@@ -321,8 +355,7 @@ class VBaseDataset(ABC):
         """
         assert self.access == _Access.WRITE
         # Build and submit commitment to get the timestamps.
-        records = [self.record_type(record_data) for record_data in record_data_list]
-        object_cids = [record.get_cid() for record in records]
+        records, object_cids = self._build_records_batch(record_data_list)
         timestamps = [self.vbc.normalize_pd_timestamp(t) for t in timestamps]
         cls = self.vbc.add_sets_objects_with_timestamps_batch(
             [self.cid] * len(records), object_cids, timestamps
@@ -399,11 +432,9 @@ class VBaseDataset(ABC):
         self.cid = self.get_set_cid_for_dataset(self.name)
         assert len(self.records) == len(self.timestamps)
 
-        self.object_cid_sum = 0
-        for i, record in enumerate(self.records):
-            timestamp = self.timestamps[i]
-            object_cid = record.get_cid()
-            self.object_cid_sum = add_int_uint256(self.object_cid_sum, object_cid)
+        object_cids = [record.get_cid() for record in self.records]
+        self.object_cid_sum = sum_uint256(object_cids)
+        for object_cid, timestamp in zip(object_cids, self.timestamps):
             if not self.vbc.verify_user_object(self.owner, object_cid, timestamp):
                 l_log.append(
                     "Invalid record: "
@@ -414,7 +445,7 @@ class VBaseDataset(ABC):
                 )
                 success = False
 
-        str_object_cid_sum = str(hex(self.object_cid_sum))
+        str_object_cid_sum = self.object_cid_sum_hex
         if not self.vbc.verify_user_set_objects(
             self.owner, self.cid, str_object_cid_sum
         ):
@@ -476,15 +507,18 @@ class VBaseDataset(ABC):
             self.timestamps = [None] * len(self.records)
 
         # Fix the timestamps using the commitment receipts.
+        # Index the receipts by object CID once so that each record lookup is O(1).
+        # If a CID has been committed multiple times, the first receipt wins.
+        receipt_inds = {}
+        for i_receipt, receipt in enumerate(commitment_receipts):
+            receipt_inds.setdefault(receipt["objectCid"], i_receipt)
+
         # Traverse all the records.
-        # The following algorithm is simplistic O(n^2).
-        # We can make this something more complex and performant it this becomes an issue.
         for i, ds_record in enumerate(self.records):
             # For each record, find the matching receipt
             # and update the corresponding timestamp.
             obj_cid = ds_record.get_cid()
-            matches = [r["objectCid"] == obj_cid for r in commitment_receipts]
-            i_match = next((i for i, v in enumerate(matches) if v), -1)
+            i_match = receipt_inds.get(obj_cid, -1)
             if i_match == -1:
                 l_log.append(
                     "Invalid record: "
@@ -12,7 +12,9 @@ import logging
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from vbase.utils.crypto_utils import (
+    hash_string,
     hash_typed_values,
+    hash_typed_values_batch,
     string_to_u64_id,
     float_to_field,
 )
@@ -23,6 +25,10 @@ _LOG = get_default_logger(__name__)
 _LOG.setLevel(logging.INFO)
 
 
+# Strings longer than this many characters are hashed incrementally.
+_STR_STREAM_THRESHOLD = 1 << 20
+
+
 class VBaseObject(ABC):
     """
     Provides basic Python vBase object features.
@@ -95,6 +101,18 @@ class VBaseObject(ABC):
         :return: The CID generated.
         """
 
+    @classmethod
+    def get_cids_for_data(cls, record_data_list: List[Any]) -> List[str]:
+        """
+        Generate content identifiers (CIDs) for a batch of objects with given data.
+        Objects with fixed ABI types override this method
+        to hash the whole batch at once.
+
+        :param record_data_list: The list of objects' data.
+        :return: The CIDs generated.
+        """
+        return [cls.get_cid_for_data(record_data) for record_data in record_data_list]
+
     def get_cid(self) -> str:
         """
         Return the content identifier (CID) for the object.
@@ -139,6 +157,12 @@ class VBaseIntObject(VBaseObject):
     def get_cid_for_data(record_data: int) -> str:
         return hash_typed_values(["uint256"], [record_data])
 
+    @classmethod
+    def get_cids_for_data(cls, record_data_list: List[int]) -> List[str]:
+        return hash_typed_values_batch(
+            ["uint256"], [[record_data] for record_data in record_data_list]
+        )
+
 
 class VBasePrivateIntObject(VBaseObject):
     """
@@ -171,6 +195,13 @@ class VBasePrivateIntObject(VBaseObject):
             ["uint256", "string"], [record_data[0], record_data[1]]
         )
 
+    @classmethod
+    def get_cids_for_data(cls, record_data_list: List[Tuple[int, str]]) -> List[str]:
+        return hash_typed_values_batch(
+            ["uint256", "string"],
+            [[record_data[0], record_data[1]] for record_data in record_data_list],
+        )
+
 
 class VBaseFloatObject(VBaseObject):
     """
@@ -193,6 +224,13 @@ class VBaseFloatObject(VBaseObject):
     def get_cid_for_data(record_data: float) -> str:
         return hash_typed_values(["uint256"], [float_to_field(record_data)])
 
+    @classmethod
+    def get_cids_for_data(cls, record_data_list: List[float]) -> List[str]:
+        return hash_typed_values_batch(
+            ["uint256"],
+            [[float_to_field(record_data)] for record_data in record_data_list],
+        )
+
 
 class VBasePrivateFloatObject(VBaseObject):
     """
@@ -223,6 +261,16 @@ class VBasePrivateFloatObject(VBaseObject):
             [float_to_field(record_data[0]), record_data[1]],
         )
 
+    @classmethod
+    def get_cids_for_data(cls, record_data_list: List[Tuple[float, str]]) -> List[str]:
+        return hash_typed_values_batch(
+            ["uint256", "string"],
+            [
+                [float_to_field(record_data[0]), record_data[1]]
+                for record_data in record_data_list
+            ],
+        )
+
 
 class VBaseStringObject(VBaseObject):
     """
@@ -242,6 +290,9 @@ class VBaseStringObject(VBaseObject):
 
     @staticmethod
     def get_cid_for_data(record_data: str) -> str:
+        if len(record_data) > _STR_STREAM_THRESHOLD:
+            # Avoid marshalling large strings in one piece.
+            return hash_string(record_data)
         return hash_typed_values(["string"], [record_data])
 
 
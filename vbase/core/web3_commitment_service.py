@@ -9,10 +9,11 @@ or via a forwarder service.
 import logging
 import pprint
 from abc import ABC
+from datetime import datetime, timezone
 from io import TextIOWrapper
 import os
 import pathlib
-from typing import List, Optional, Type, Union
+from typing import Iterable, List, Optional, Type, Union
 import pandas as pd
 from web3 import Web3
 from web3.contract import Contract
@@ -38,6 +39,10 @@ class Web3CommitmentService(CommitmentService, ABC):
     ):
         self.w3 = w3
         self.csc = commitment_service_contract
+        # Create event processors once.
+        # Each events.<Event>() call rebuilds the event from the ABI.
+        self._add_set_event = self.csc.events.AddSet()
+        self._add_object_event = self.csc.events.AddObject()
 
     @staticmethod
     def get_commitment_service_json_file(
@@ -74,6 +79,21 @@ class Web3CommitmentService(CommitmentService, ABC):
 
     @staticmethod
     def convert_timestamp_str_to_chain(ts: str) -> int:
+        if isinstance(ts, str):
+            # Parse ISO 8601 strings, such as those returned by
+            # convert_timestamp_chain_to_str(), using the standard library.
+            # This is considerably cheaper than constructing a pd.Timestamp.
+            # Python 3.11+ also accepts the trailing "Z" UTC designator.
+            # Other formats accepted by pd.Timestamp fall through to pandas below.
+            try:
+                dt = datetime.fromisoformat(ts)
+            except ValueError:
+                dt = None
+            if dt is not None:
+                if dt.tzinfo is None:
+                    # pd.Timestamp treats naive timestamps as UTC.
+                    dt = dt.replace(tzinfo=timezone.utc)
+                return int(dt.timestamp())
         return int(pd.Timestamp(ts).timestamp())
 
     @staticmethod
@@ -81,6 +101,12 @@ class Web3CommitmentService(CommitmentService, ABC):
         # Ethereum and Web3 use UTC as the time zone.
         return str(pd.Timestamp(ts, unit="s", tz="UTC"))
 
+    @staticmethod
+    def convert_timestamps_chain_to_str(ts_list: Iterable[int]) -> List[str]:
+        # Convert all timestamps in a single pandas call.
+        # The string format matches convert_timestamp_chain_to_str().
+        return pd.to_datetime(list(ts_list), unit="s", utc=True).astype(str).tolist()
+
     @staticmethod
     def _check_tx_success(receipt):
         if receipt is None:
@@ -112,7 +138,7 @@ class Web3CommitmentService(CommitmentService, ABC):
         if len(receipt["logs"]) > 0:
             # On some chains other events may be emitted, such as LogFeeTransfer.
             # Return the AddSet event data from the 1st event.
-            event_data = self.csc.events.AddSet().process_log(receipt["logs"][0])
+            event_data = self._add_set_event.process_log(receipt["logs"][0])
             if event_data["event"] == "AddSet":
                 # Convert bytestrings to strings to allow serialization for the upper layers.
                 # Note that HexBytes is also not JSON serializable.
@@ -158,7 +184,7 @@ class Web3CommitmentService(CommitmentService, ABC):
 
         # On some chains other events may be emitted, such as LogFeeTransfer.
         # Return the AddSet event data from the 1st event.
-        event_data = self.csc.events.AddObject().process_log(receipt["logs"][0])
+        event_data = self._add_object_event.process_log(receipt["logs"][0])
 
         cl = dict(event_data["args"])
         # Convert bytestring to string
@@ -188,7 +214,7 @@ class Web3CommitmentService(CommitmentService, ABC):
         # AddObject(user, objectCid, timestamp)
         # On some chains other events may be emitted, such as LogFeeTransfer.
         # Return the object commitment log from the 2nd event.
-        event_data = self.csc.events.AddObject().process_log(receipt["logs"][1])
+        event_data = self._add_object_event.process_log(receipt["logs"][1])
 
         # Prepare the commitment log using the returned event data.
         cl = dict(event_data["args"])
@@ -222,7 +248,7 @@ class Web3CommitmentService(CommitmentService, ABC):
         for i, log in enumerate(receipt["logs"]):
             if i % 2 == 0:
                 continue
-            event_data = self.csc.events.AddObject().process_log(log)
+            event_data = self._add_object_event.process_log(log)
             # Convert bytestrings to strings to allow serialization for the
             # upper layers.
             cl = dict(event_data["args"])
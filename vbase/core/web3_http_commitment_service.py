@@ -8,6 +8,7 @@ import json
 import logging
 import os
 import pprint
+import random
 import time
 from typing import List, Optional, Union
 from dotenv import load_dotenv
@@ -33,6 +34,9 @@ _LOG.setLevel(logging.INFO)
 _W3_CONNECTION_MAX_RETRIES = 5
 # Linear backoff in seconds.
 _W3_CONNECTION_BACKOFF = 1
+# Fraction of the backoff that is randomized to spread out
+# retries of clients that fail at the same time.
+_W3_CONNECTION_BACKOFF_JITTER = 0.5
 
 
 class Web3HTTPCommitmentService(Web3CommitmentService):
@@ -86,6 +90,7 @@ class Web3HTTPCommitmentService(Web3CommitmentService):
         # Connect to the node with retries and backoff.
         retry_count = 0
         backoff = 0
+        connected = False
         while retry_count < _W3_CONNECTION_MAX_RETRIES:
             try:
                 w3 = Web3(Web3.HTTPProvider(self.node_rpc_url))
@@ -94,6 +99,7 @@ class Web3HTTPCommitmentService(Web3CommitmentService):
                         "Web3HTTPCommitmentService.__init__(): Connected to %s",
                         self.node_rpc_url,
                     )
+                    connected = True
                     break
                 raise ConnectionError(f"Failed to connect to {self.node_rpc_url}")
             except ConnectionError as e:
@@ -104,10 +110,14 @@ class Web3HTTPCommitmentService(Web3CommitmentService):
                     e,
                 )
                 retry_count += 1
-                backoff += _W3_CONNECTION_BACKOFF
-                time.sleep(backoff)
+                # Do not wait after the last attempt.
+                if retry_count < _W3_CONNECTION_MAX_RETRIES:
+                    backoff += _W3_CONNECTION_BACKOFF
+                    time.sleep(
+                        backoff * (1 - _W3_CONNECTION_BACKOFF_JITTER * random.random())
+                    )
 
-        if not w3.is_connected():
+        if not connected:
             raise ConnectionError(
                 f"Failed to connect to {self.node_rpc_url} after {retry_count} retries"
             )
@@ -213,6 +223,16 @@ class Web3HTTPCommitmentService(Web3CommitmentService):
             self.convert_timestamp_str_to_chain(timestamp),
         ).call()
 
+    def verify_user_objects_batch(
+        self, user: str, object_cids: List[str], timestamps: List[str]
+    ) -> List[bool]:
+        return self.csc.functions.verifyUserObjectsBatch(
+            user,
+            # Convert strings to bytes.
+            [hex_str_to_bytes(object_cid) for object_cid in object_cids],
+            [self.convert_timestamp_str_to_chain(ts) for ts in timestamps],
+        ).call()
+
     def add_set_object(self, set_cid: str, object_cid: str) -> dict:
         _LOG.debug("Sending transaction to addSetObject")
         tx_hash = self.csc.functions.addSetObject(
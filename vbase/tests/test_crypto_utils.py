@@ -10,6 +10,15 @@ from vbase.utils.crypto_utils import (
     solidity_hash_typed_values,
     convert_typed_values_to_bytes,
     hash_typed_values,
+    hash_string,
+    hash_typed_values_batch,
+    add_int_uint256,
+    add_uint256_uint256,
+    add_uint256_uint256_int,
+    float_to_field,
+    field_to_float,
+    sum_uint256,
+    hex_str_to_bytes,
 )
 
 
@@ -114,6 +123,80 @@ class TestCryptoUtils(unittest.TestCase):
         )
         self.assertEqual(vbase_hash, sha3_hash)
 
+    def test_hash_string(self):
+        """
+        Test chunked string hash against hash_typed_values.
+        """
+        for s in [
+            "",
+            _STR_TEST,
+            "Unicode: \u00e9\u4e2d\U0001f600" * 1000,
+            "String1" * int(1e6),
+        ]:
+            self.assertEqual(hash_string(s), hash_typed_values(["string"], [s]))
+
+    def test_hash_typed_values_batch(self):
+        """
+        Test batch hashes against hash_typed_values.
+        """
+        abi_types = ["uint256", "string", "uint64", "bytes32"]
+        values_list = [
+            [i, f"{_STR_TEST} \u00e9{i}", 2**64 - 1 - i, "0x" + f"{i:02x}" * 32]
+            for i in range(0, 10)
+        ]
+        self.assertEqual(
+            hash_typed_values_batch(abi_types, values_list),
+            [hash_typed_values(abi_types, values) for values in values_list],
+        )
+        # Invalid values should be rejected as in the generic marshalling.
+        for value in [-1, 2**256, True, 1.5]:
+            with self.subTest(value=value):
+                with self.assertRaises((TypeError, ValueError)):
+                    hash_typed_values_batch(["uint256"], [[value]])
+        # Unsized uint types should be rejected as in the generic marshalling.
+        with self.assertRaises(ValueError):
+            hash_typed_values_batch(["uint"], [[5]])
+
+    def test_field_float_round_trip(self):
+        """
+        Test conversion of floats to field elements and back.
+        """
+        for x in [0.0, 0.001, 0.5, -0.5, 1.25, -1.25, 1234.5, -1234.5]:
+            with self.subTest(x=x):
+                self.assertEqual(field_to_float(float_to_field(x)), x)
+
+    def test_add_uint256(self):
+        """
+        Test uint256 addition with overflow and wrap-around.
+        """
+        max_uint256 = 2**256 - 1
+        for n1, n2 in [(0, 0), (1, 2), (max_uint256, 1), (max_uint256, max_uint256)]:
+            expected = (n1 + n2) % (2**256)
+            self.assertEqual(add_uint256_uint256_int(n1, n2), expected)
+            self.assertEqual(add_int_uint256(n1, hex(n2)), expected)
+            self.assertEqual(add_uint256_uint256(hex(n1), hex(n2)), hex(expected))
+
+    def test_sum_uint256(self):
+        """
+        Test uint256 sums against accumulated uint256 additions.
+        """
+        hex_strs = [hex(2**256 - 1 - i) for i in range(0, 10)] + ["0x1", "0x2"]
+        expected = 0
+        for hex_str in hex_strs:
+            expected = add_int_uint256(expected, hex_str)
+        self.assertEqual(sum_uint256(hex_strs), expected)
+        self.assertEqual(sum_uint256([]), 0)
+
+    def test_hex_str_to_bytes(self):
+        """
+        Test hex string conversion with and without the 0x prefix.
+        """
+        expected = bytes([0x01, 0xAB, 0xFF])
+        for hex_str in ["0x01abff", "0X01ABFF", "01abff"]:
+            with self.subTest(hex_str=hex_str):
+                self.assertEqual(hex_str_to_bytes(hex_str), expected)
+        self.assertEqual(hex_str_to_bytes("0x"), b"")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -18,6 +18,7 @@ from vbase.utils.log import get_default_logger
 from vbase.tests.utils import (
     create_dataset_worker,
     dataset_from_json_checks,
+    dataset_set_objects_checks,
 )
 
 
@@ -62,14 +63,9 @@ class TestSim(unittest.TestCase):
             ts.append(t)
             cl = dsw.add_record_with_timestamp(x, t)
             assert self.vbc.verify_user_object(dsw.owner, cl["objectCid"], t)
-            assert self.vbc.verify_user_set_objects(
-                dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-            )
+            dataset_set_objects_checks(self.vbc, dsw)
             assert cl["timestamp"] == self.vbc.normalize_pd_timestamp(t)
             time.sleep(1)
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
         dataset_from_json_checks(self.vbc, dsw)
 
         # Run a simulation invoking a PIT calculation on the latest record for each sim t.
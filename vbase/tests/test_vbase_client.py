@@ -2,7 +2,8 @@
 Tests of the vbase_client module
 """
 
-from typing import List
+from datetime import datetime, timedelta
+from typing import List, Sequence
 import unittest
 import pandas as pd
 
@@ -12,19 +13,44 @@ from vbase.tests.utils import (
     int_to_hash,
     TEST_HASH1,
     TEST_HASH2,
+    verify_concurrently,
 )
 
 
+# Hash constants used in batch tests.
+# Build these once rather than on every test and loop iteration.
+_SET_CIDS = (TEST_HASH1,) * 4
+_OBJECT_HASHES = tuple(int_to_hash(i) for i in range(1, 5))
+# Hashes of objects that have not been committed at a given batch index.
+_BOGUS_OBJECT_HASHES = tuple(int_to_hash(i + 100) for i in range(0, 4))
+# Hashes of batch objects committed at the following index.
+_NEXT_OBJECT_HASHES = tuple(int_to_hash(i + 2) for i in range(0, 4))
+# The object CID sum for _OBJECT_HASHES, 1 + 2 + 3 + 4 = 10, and a bogus sum.
+_OBJECT_HASHES_SUM = int_to_hash(10)
+_BOGUS_OBJECT_HASHES_SUM = int_to_hash(10 + 1)
+
+
 class TestVBaseClient(unittest.TestCase):
     """
     Test base vBase client functionality.
     """
 
+    vbc: VBaseClientTest
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the test class.
+        Create the client once for all tests since the construction
+        loads settings and connects to the commitment service.
+        """
+        cls.vbc = VBaseClientTest.create_instance_from_env()
+
     def setUp(self):
         """
         Set up the tests.
+        Reset the commitment state shared by the tests.
         """
-        self.vbc = VBaseClientTest.create_instance_from_env()
         self.vbc.clear_set_objects(TEST_HASH1)
         self.vbc.clear_sets()
         cl = self.vbc.add_set(TEST_HASH1)
@@ -65,7 +91,7 @@ class TestVBaseClient(unittest.TestCase):
         assert not self.vbc.verify_user_object(
             cl["user"],
             cl["objectCid"],
-            str(pd.Timestamp(cl["timestamp"]) + pd.Timedelta(hours=1)),
+            str(datetime.fromisoformat(cl["timestamp"]) + timedelta(hours=1)),
         )
         # Check bogus hash.
         assert not self.vbc.verify_user_object(cl["user"], TEST_HASH2, cl["timestamp"])
@@ -85,27 +111,50 @@ class TestVBaseClient(unittest.TestCase):
         """
         Test a batch set object commitment.
         """
-        object_hashes = [int_to_hash(i) for i in range(1, 5)]
-        cl = self.vbc.add_sets_objects_batch([TEST_HASH1] * 4, object_hashes)
+        cl = self.vbc.add_sets_objects_batch(list(_SET_CIDS), list(_OBJECT_HASHES))
         assert len(cl) == 4
+        # All commitments are made by the same user to the same set,
+        # so the set checks do not depend on the commitment and are made once.
+        user = cl[0]["user"]
+        assert all(cl[i]["user"] == user for i in range(0, 4))
+        # The verification calls are independent, so issue them concurrently.
+        calls = [
+            (
+                self.vbc.verify_user_set_objects,
+                (user, TEST_HASH1, _OBJECT_HASHES_SUM),
+                True,
+            ),
+            (
+                self.vbc.verify_user_set_objects,
+                (user, TEST_HASH1, _BOGUS_OBJECT_HASHES_SUM),
+                False,
+            ),
+        ]
+        # Check all bogus commitments with a single batch call.
+        bogus_object_cids = []
+        bogus_timestamps = []
         for i in range(0, 4):
-            assert self.vbc.verify_user_object(
-                cl[i]["user"], object_hashes[i], cl[i]["timestamp"]
-            )
-            assert not self.vbc.verify_user_object(
-                cl[i]["user"], int_to_hash(i + 100), cl[i]["timestamp"]
-            )
-            assert not self.vbc.verify_user_object(
-                cl[i]["user"],
-                int_to_hash(i + 100),
-                pd.Timestamp(cl[i]["timestamp"]) - pd.Timedelta(seconds=1),
-            )
-            assert self.vbc.verify_user_set_objects(
-                cl[i]["user"], TEST_HASH1, int_to_hash(10)
+            timestamp = cl[i]["timestamp"]
+            calls.append(
+                (
+                    self.vbc.verify_user_object,
+                    (user, _OBJECT_HASHES[i], timestamp),
+                    True,
+                )
             )
-            assert not self.vbc.verify_user_set_objects(
-                cl[i]["user"], TEST_HASH1, int_to_hash(10 + 1)
+            bogus_object_cids += [_BOGUS_OBJECT_HASHES[i]] * 2
+            bogus_timestamps += [
+                timestamp,
+                str(datetime.fromisoformat(timestamp) - timedelta(seconds=1)),
+            ]
+        calls.append(
+            (
+                self.vbc.verify_user_objects_batch,
+                (user, bogus_object_cids, bogus_timestamps),
+                [False] * len(bogus_object_cids),
             )
+        )
+        verify_concurrently(calls)
 
     def test_add_set_object_with_timestamp(self):
         """
@@ -125,27 +174,50 @@ class TestVBaseClient(unittest.TestCase):
         assert not self.vbc.verify_user_set_objects(cl["user"], TEST_HASH2, TEST_HASH1)
 
     def _verify_sets_objects_batch(
-        self, cl: dict, object_hashes: List[str], timestamps: List[str]
+        self, cl: List[dict], object_hashes: Sequence[str], timestamps: List[str]
     ):
         assert len(cl) == 4
+        # All commitments are made by the same user to the same set,
+        # so the set checks do not depend on the commitment and are made once.
+        user = cl[0]["user"]
+        assert all(cl[i]["user"] == user for i in range(0, 4))
+        # The verification calls are independent, so issue them concurrently.
+        calls = [
+            (
+                self.vbc.verify_user_set_objects,
+                (user, TEST_HASH1, _OBJECT_HASHES_SUM),
+                True,
+            ),
+            (
+                self.vbc.verify_user_set_objects,
+                (user, TEST_HASH1, _BOGUS_OBJECT_HASHES_SUM),
+                False,
+            ),
+        ]
+        # Check all bogus commitments with a single batch call.
+        bogus_object_cids = []
+        bogus_timestamps = []
         for i in range(0, 4):
-            assert self.vbc.verify_user_object(
-                cl[i]["user"], object_hashes[i], timestamps[i]
-            )
-            assert not self.vbc.verify_user_object(
-                cl[i]["user"],
-                object_hashes[i],
-                str(pd.Timestamp(timestamps[i]) + pd.DateOffset(hours=1)),
-            )
-            assert not self.vbc.verify_user_object(
-                cl[i]["user"], int_to_hash(i + 2), timestamps[i]
-            )
-            assert self.vbc.verify_user_set_objects(
-                cl[i]["user"], TEST_HASH1, int_to_hash(10)
+            calls.append(
+                (
+                    self.vbc.verify_user_object,
+                    (user, object_hashes[i], timestamps[i]),
+                    True,
+                )
             )
-            assert not self.vbc.verify_user_set_objects(
-                cl[i]["user"], TEST_HASH1, int_to_hash(10 + 1)
+            bogus_object_cids += [object_hashes[i], _NEXT_OBJECT_HASHES[i]]
+            bogus_timestamps += [
+                str(datetime.fromisoformat(timestamps[i]) + timedelta(hours=1)),
+                timestamps[i],
+            ]
+        calls.append(
+            (
+                self.vbc.verify_user_objects_batch,
+                (user, bogus_object_cids, bogus_timestamps),
+                [False] * len(bogus_object_cids),
             )
+        )
+        verify_concurrently(calls)
 
     def test_add_sets_objects_with_timestamps_batch(self):
         """
@@ -153,15 +225,13 @@ class TestVBaseClient(unittest.TestCase):
         """
         # Use an internal function to quickly build timestamps.
         # noinspection PyUnresolvedReferences
-        timestamps = [
-            self.vbc.commitment_service.convert_timestamp_chain_to_str(ts)
-            for ts in range(1, 5)
-        ]
-        object_hashes = [int_to_hash(i) for i in range(1, 5)]
+        timestamps = self.vbc.commitment_service.convert_timestamps_chain_to_str(
+            range(1, 5)
+        )
         cl = self.vbc.add_sets_objects_with_timestamps_batch(
-            [TEST_HASH1] * 4, object_hashes, timestamps
+            list(_SET_CIDS), list(_OBJECT_HASHES), timestamps
         )
-        self._verify_sets_objects_batch(cl, object_hashes, timestamps)
+        self._verify_sets_objects_batch(cl, _OBJECT_HASHES, timestamps)
 
     def test_add_set_objects_with_timestamps_batch(self):
         """
@@ -169,15 +239,13 @@ class TestVBaseClient(unittest.TestCase):
         """
         # Use an internal function to quickly build timestamps.
         # noinspection PyUnresolvedReferences
-        timestamps = [
-            self.vbc.commitment_service.convert_timestamp_chain_to_str(ts)
-            for ts in range(1, 5)
-        ]
-        object_hashes = [int_to_hash(i) for i in range(1, 5)]
+        timestamps = self.vbc.commitment_service.convert_timestamps_chain_to_str(
+            range(1, 5)
+        )
         cl = self.vbc.add_set_objects_with_timestamps_batch(
-            TEST_HASH1, object_hashes, timestamps
+            TEST_HASH1, list(_OBJECT_HASHES), timestamps
         )
-        self._verify_sets_objects_batch(cl, object_hashes, timestamps)
+        self._verify_sets_objects_batch(cl, _OBJECT_HASHES, timestamps)
 
 
 if __name__ == "__main__":
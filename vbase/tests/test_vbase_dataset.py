@@ -3,14 +3,16 @@ Tests of the vbase_dataset module
 """
 
 from datetime import datetime, timedelta
+import json
 import logging
 import time
+from typing import Any, List, Type
 import unittest
-import pandas as pd
 
 from vbase.utils.crypto_utils import add_uint256_uint256
 from vbase.core.vbase_client import VBaseClient
 from vbase.core.vbase_object import (
+    VBaseObject,
     VBaseIntObject,
     VBasePrivateIntObject,
     VBaseStringObject,
@@ -26,51 +28,98 @@ from vbase.tests.utils import (
     create_dataset_worker,
     dataset_add_record_checks,
     dataset_from_json_checks,
+    dataset_set_objects_checks,
 )
 
 
 _LOG = get_default_logger(__name__)
 _LOG.setLevel(logging.INFO)
 
+# Record types and functions building the i-th record's data
+# for the simple timeseries write and read tests.
+_TS_WR_CASES = [
+    (VBaseFloatObject, lambda i: float(i) / 10),
+    (VBasePrivateFloatObject, lambda i: (float(i) / 10, str(i))),
+    (
+        VBaseJsonObject,
+        lambda i: json.dumps({"AAA": 0.2, "BBB": 0.3 + i / 100, "CCC": 0.5 - i / 100}),
+    ),
+    (
+        VBasePortfolioObject,
+        lambda i: dict(zip(["AAA", "BBB", "CCC"], [0.2, 0.3 + i / 100, 0.5 - i / 100])),
+    ),
+    (VBaseStringObject, lambda i: f"String{i}"),
+]
+
 
 class TestVBaseDataset(unittest.TestCase):
     """
     Test base vBase dataset functionality.
     """
 
-    def setUp(self):
+    vbc: VBaseClientTest
+
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up the tests.
+        Set up the test class.
+        Create the client once for all tests since the construction
+        loads settings and connects to the commitment service.
+        Each test resets the dataset state it uses with create_dataset_worker().
         """
-        self.vbc = VBaseClientTest.create_instance_from_env()
+        cls.vbc = VBaseClientTest.create_instance_from_env()
 
     @staticmethod
     def _add_record_worker(
-        vbc: VBaseClient, dsw: VBaseDataset, record_data: any, t_prev: pd.Timestamp
+        vbc: VBaseClient, dsw: VBaseDataset, record_data: any, t_prev: str
     ):
         cl = dsw.add_record(record_data)
         dataset_add_record_checks(vbc, dsw, cl, t_prev)
         return cl, cl["timestamp"]
 
+    def _run_batch_test(
+        self, record_type: Type[VBaseObject], record_data_list: List[Any]
+    ) -> VBaseDataset:
+        """
+        Common test code to write a dataset using a single batch commitment.
+
+        :param record_type: The dataset record type.
+        :param record_data_list: The list of records' data.
+        :return: The written dataset.
+        """
+        dsw = create_dataset_worker(self.vbc, record_type)
+        cls = dsw.add_records_batch(record_data_list)
+        assert len(cls) == len(record_data_list)
+        for cl, record_data in zip(cls, record_data_list):
+            assert cl["objectCid"] == record_type.get_cid_for_data(record_data)
+        assert all(
+            self.vbc.verify_user_objects_batch(
+                dsw.owner,
+                [cl["objectCid"] for cl in cls],
+                [cl["timestamp"] for cl in cls],
+            )
+        )
+        dataset_set_objects_checks(self.vbc, dsw)
+        return dsw
+
     def test_1d_int_ts_wr(self):
         """
         Test a simple int 1-dimension timeseries write and read.
         """
         dsw = create_dataset_worker(self.vbc, VBaseIntObject)
+        # This test covers serial add_record() calls and timestamp ordering.
+        # Tests of other record types use a single batch commitment.
         # Record 4 commitments over 4 blocks.
         # We should get a new block with each commitment due to automine.
         # Sleep briefly to make sure timestamps don't collide.
         # We can test a max 4 commitments
         # since hardhat localhost node has issues handling more than 8 events
         # emitted in a single transaction.
-        t_prev = 0
+        t_prev = self.vbc.commitment_service.convert_timestamp_chain_to_str(0)
         for i in range(1, 5):
             # Commit an integer.
             cl, t_prev = self._add_record_worker(self.vbc, dsw, i, t_prev)
             assert cl is not None
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
         dataset_from_json_checks(self.vbc, dsw)
 
     def test_1d_int_ts_batch_wr(self):
@@ -80,20 +129,17 @@ class TestVBaseDataset(unittest.TestCase):
         dsw = create_dataset_worker(self.vbc, VBaseIntObject)
         record_data_list = list(range(1, 5))
         cls = dsw.add_records_batch(record_data_list)
-        for i, record_data in enumerate(record_data_list):
-            assert self.vbc.verify_user_object(
-                dsw.owner,
-                dsw.record_type.get_cid_for_data(record_data),
-                cls[0]["timestamp"],
-            )
-            assert self.vbc.verify_user_object(
-                dsw.owner,
-                dsw.record_type.get_cid_for_data(record_data),
-                cls[i]["timestamp"],
-            )
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
+        # The committed CIDs must match the per-record CIDs of the data.
+        for cl, record_data in zip(cls, record_data_list):
+            assert cl["objectCid"] == dsw.record_type.get_cid_for_data(record_data)
+        # All records are committed in one transaction and share a timestamp.
+        timestamps = [cl["timestamp"] for cl in cls]
+        assert all(ts == timestamps[0] for ts in timestamps)
+        # Verify all records with a single batch call
+        # using the committed CIDs checked above.
+        cids = [cl["objectCid"] for cl in cls]
+        assert all(self.vbc.verify_user_objects_batch(dsw.owner, cids, timestamps))
+        dataset_set_objects_checks(self.vbc, dsw)
         dataset_from_json_checks(self.vbc, dsw)
 
     def test_pri_1d_int_ts_batch_wr(self):
@@ -103,89 +149,29 @@ class TestVBaseDataset(unittest.TestCase):
         dsw = create_dataset_worker(self.vbc, VBasePrivateIntObject)
         record_data_list = [(i, str(i)) for i in range(1, 5)]
         cls = dsw.add_records_batch(record_data_list)
-        for i, record in enumerate(record_data_list):
-            assert self.vbc.verify_user_object(
-                dsw.owner,
-                dsw.record_type.get_cid_for_data(record),
-                cls[0]["timestamp"],
-            )
-            assert self.vbc.verify_user_object(
-                dsw.owner,
-                dsw.record_type.get_cid_for_data(record),
-                cls[i]["timestamp"],
-            )
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
-        dataset_from_json_checks(self.vbc, dsw)
-
-    def test_1d_float_ts_wr(self):
-        """
-        Test a simple float 1-dimension timeseries write and read.
-        """
-        dsw = create_dataset_worker(self.vbc, VBaseFloatObject)
-        t_prev = self.vbc.commitment_service.convert_timestamp_chain_to_str(0)
-        for i in range(1, 5):
-            # Commit a float.
-            cl, t_prev = self._add_record_worker(self.vbc, dsw, float(i) / 10, t_prev)
-            assert cl is not None
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
-        dataset_from_json_checks(self.vbc, dsw)
-
-    def test_pri_1d_float_ts_wr(self):
-        """
-        Test a private float 1-dimension timeseries write and read.
-        """
-        dsw = create_dataset_worker(self.vbc, VBasePrivateFloatObject)
-        # Use an internal function to quickly build timestamps.
-        # noinspection PyUnresolvedReferences
-        t_prev = self.vbc.commitment_service.convert_timestamp_chain_to_str(0)
-        for i in range(1, 5):
-            # Commit a float.
-            cl, t_prev = self._add_record_worker(
-                self.vbc, dsw, [float(i) / 10, str(i)], t_prev
-            )
-            assert cl is not None
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
-        dataset_from_json_checks(self.vbc, dsw)
-
-    def test_2d_json_ts_wr(self):
-        """
-        Test 2-dimension timeseries of Json records write and read.
-        """
-        dsw = create_dataset_worker(self.vbc, VBaseJsonObject)
-        t_prev = 0
-        for i in range(1, 5):
-            # Commit a JSON object.
-            data = pd.Series(
-                [0.2, 0.3 + i / 100, 0.5 - i / 100], index=["AAA", "BBB", "CCC"]
-            ).to_json()
-            cl, t_prev = self._add_record_worker(self.vbc, dsw, data, t_prev)
-            assert cl is not None
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
+        # The committed CIDs must match the per-record CIDs of the data.
+        for cl, record_data in zip(cls, record_data_list):
+            assert cl["objectCid"] == dsw.record_type.get_cid_for_data(record_data)
+        # All records are committed in one transaction and share a timestamp.
+        timestamps = [cl["timestamp"] for cl in cls]
+        assert all(ts == timestamps[0] for ts in timestamps)
+        # Verify all records with a single batch call
+        # using the committed CIDs checked above.
+        cids = [cl["objectCid"] for cl in cls]
+        assert all(self.vbc.verify_user_objects_batch(dsw.owner, cids, timestamps))
+        dataset_set_objects_checks(self.vbc, dsw)
         dataset_from_json_checks(self.vbc, dsw)
 
-    def test_port_wr(self):
+    def test_1d_ts_wr(self):
         """
-        Test timeseries of portfolio records write and read.
+        Test simple timeseries writes and reads for various record types.
         """
-        dsw = create_dataset_worker(self.vbc, VBasePortfolioObject)
-        t_prev = 0
-        for i in range(1, 5):
-            # Commit a JSON object.
-            data = dict(zip(["AAA", "BBB", "CCC"], [0.2, 0.3 + i / 100, 0.5 - i / 100]))
-            cl, t_prev = self._add_record_worker(self.vbc, dsw, data, t_prev)
-            assert cl is not None
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
-        dataset_from_json_checks(self.vbc, dsw)
+        for record_type, data_fn in _TS_WR_CASES:
+            with self.subTest(record_type=record_type.__name__):
+                dsw = self._run_batch_test(
+                    record_type, [data_fn(i) for i in range(1, 5)]
+                )
+                dataset_from_json_checks(self.vbc, dsw)
 
     def test_port_pub_ret(self):
         """
@@ -193,16 +179,14 @@ class TestVBaseDataset(unittest.TestCase):
         """
 
         # Create the portfolio dataset.
+        # create_dataset_worker() clears any stale TestPort commitments.
         dsw_port = create_dataset_worker(self.vbc, VBasePortfolioObject, "TestPort")
-        self.vbc.clear_named_set_objects("TestPort")
         # Record a portfolio commitment.
         cl = dsw_port.add_record({"AAA": 0.90, "BBB": 0.10})
         assert self.vbc.verify_user_object(
             dsw_port.owner, cl["objectCid"], cl["timestamp"]
         )
-        assert self.vbc.verify_user_set_objects(
-            dsw_port.owner, dsw_port.cid, str(hex(dsw_port.object_cid_sum))
-        )
+        dataset_set_objects_checks(self.vbc, dsw_port)
 
         # Create the return dataset.
         dsw_rets = VBaseDataset(
@@ -214,47 +198,21 @@ class TestVBaseDataset(unittest.TestCase):
         assert self.vbc.verify_user_object(
             dsw_rets.owner, cl["objectCid"], cl["timestamp"]
         )
-        assert self.vbc.verify_user_set_objects(
-            dsw_rets.owner, dsw_rets.cid, str(hex(dsw_rets.object_cid_sum))
-        )
+        dataset_set_objects_checks(self.vbc, dsw_rets)
 
         assert self.vbc.verify_user_sets(
             dsw_port.owner, add_uint256_uint256(dsw_port.cid, dsw_rets.cid)
         )
 
-    def test_str_ts_wr(self):
-        """
-        Test timeseries of string records write and read.
-        """
-        dsw = create_dataset_worker(self.vbc, VBaseStringObject)
-        t_prev = 0
-        for i in range(1, 5):
-            # Commit a string object.
-            data = f"String{i}"
-            cl, t_prev = self._add_record_worker(self.vbc, dsw, data, t_prev)
-            assert cl is not None
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
-        dataset_from_json_checks(self.vbc, dsw)
-
     def test_large_str_ts_wr(self):
         """
         Test timeseries of large string records writes and reads.
         """
-        dsw = create_dataset_worker(self.vbc, VBaseStringObject)
-        t_prev = 0
-        for i in range(1, 5):
-            # Commit a string object.
-            data = f"String{i}" * int(1e6)
-            start_time = time.perf_counter()
-            cl, t_prev = self._add_record_worker(self.vbc, dsw, data, t_prev)
-            total_time = time.perf_counter() - start_time
-            _LOG.info("add_record() took %.6f seconds", total_time)
-            assert cl is not None
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
+        record_data_list = [f"String{i}" * int(1e6) for i in range(1, 5)]
+        start_time = time.perf_counter()
+        dsw = self._run_batch_test(VBaseStringObject, record_data_list)
+        total_time = time.perf_counter() - start_time
+        _LOG.info("add_records_batch() took %.6f seconds", total_time)
         start_time = time.perf_counter()
         dataset_from_json_checks(self.vbc, dsw, False)
         total_time = time.perf_counter() - start_time
@@ -266,14 +224,10 @@ class TestVBaseDataset(unittest.TestCase):
         """
         dsw = create_dataset_worker(self.vbc, VBaseIntObject)
         # Record 4 commitments over 4 blocks.
-        t_prev = 0
+        t_prev = self.vbc.commitment_service.convert_timestamp_chain_to_str(0)
         for i in range(1, 5):
             cl, t_prev = self._add_record_worker(self.vbc, dsw, i, t_prev)
             assert cl is not None
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
-        dataset_from_json_checks(self.vbc, dsw)
         # Mess up the timestamps.
         dsw.timestamps = [
             str(datetime.fromisoformat(t) + timedelta(seconds=1))
@@ -295,14 +249,10 @@ class TestVBaseDataset(unittest.TestCase):
         """
         dsw = create_dataset_worker(self.vbc, VBaseIntObject)
         # Record 4 commitments over 4 blocks.
-        t_prev = 0
+        t_prev = self.vbc.commitment_service.convert_timestamp_chain_to_str(0)
         for i in range(1, 5):
             cl, t_prev = self._add_record_worker(self.vbc, dsw, i, t_prev)
             assert cl is not None
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
-        dataset_from_json_checks(self.vbc, dsw)
         # Mess up the timestamps by adding a bogus record.
         dsw.records.append(VBaseIntObject(42))
         dsw.timestamps.append(datetime.now())
@@ -6,7 +6,6 @@ import asyncio
 import logging
 import time
 import unittest
-import pandas as pd
 
 from vbase.core.vbase_client import VBaseClient
 from vbase.core.vbase_client_test import VBaseClientTest
@@ -37,6 +36,26 @@ class TestVBaseDatasetAsync(unittest.TestCase):
     Test base vBase dataset async functionality.
     """
 
+    loop: asyncio.AbstractEventLoop
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the test class.
+        Create a single event loop to run the async workers of all tests.
+        """
+        cls.loop = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Tear down the test class.
+        """
+        # shutdown_default_executor() is available in Python 3.9+.
+        if hasattr(cls.loop, "shutdown_default_executor"):
+            cls.loop.run_until_complete(cls.loop.shutdown_default_executor())
+        cls.loop.close()
+
     def setUp(self):
         """
         Set up the tests.
@@ -48,22 +67,24 @@ class TestVBaseDatasetAsync(unittest.TestCase):
         vbc: VBaseClient,
         dsw: VBaseDatasetAsync,
         record_data: any,
-        t_prev: pd.Timestamp,
+        t_prev: str,
     ):
         # Test the async record creation.
-        start_time = time.time()
+        start_time = time.perf_counter()
         task = asyncio.create_task(dsw.add_record_async(record_data))
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         _LOG.info(
             "dsw.add_record_async(record_data) create_task took %s seconds.",
             elapsed_time,
         )
         self.assertTrue(elapsed_time < _NON_BLOCKING_INTERVAL)
+        # The task can only run once we yield to the event loop.
+        self.assertFalse(task.done())
 
         # Test the await for record creation.
-        start_time = time.time()
+        start_time = time.perf_counter()
         cl = await task
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         _LOG.info(
             "dsw.add_record_async(record_data) await took %s seconds.", elapsed_time
         )
@@ -82,22 +103,24 @@ class TestVBaseDatasetAsync(unittest.TestCase):
 
         # Test the async dataset creation.
         # We need to call the async VBaseDatasetAsync.create() factory method.
-        start_time = time.time()
+        start_time = time.perf_counter()
         task = asyncio.create_task(
             VBaseDatasetAsync.create(
                 self.vbc, name=dataset_name, record_type=VBaseIntObject
             )
         )
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         _LOG.info(
             "VBaseDatasetAsync.create() create_task took %s seconds.", elapsed_time
         )
         self.assertTrue(elapsed_time < _NON_BLOCKING_INTERVAL)
+        # The task can only run once we yield to the event loop.
+        self.assertFalse(task.done())
 
         # Test the await for dataset creation.
-        start_time = time.time()
+        start_time = time.perf_counter()
         dsw = await task
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         _LOG.info("VBaseDatasetAsync.create() await took %s seconds.", elapsed_time)
         self.assertTrue(elapsed_time > _NON_BLOCKING_INTERVAL)
         self.assertTrue(self.vbc.verify_user_sets(dsw.owner, dsw.cid))
@@ -109,29 +132,27 @@ class TestVBaseDatasetAsync(unittest.TestCase):
         """
         # In the unittest framework, test methods are expected to be synchronous functions.
         # unittest doesn't natively support async test methods.
-        # Define a synchronous test method and call asyncio.run to run the asynchronous code.
-        asyncio.run(self.dataset_creation_async())
+        # Define a synchronous test method and run the asynchronous code
+        # on the event loop shared by the class tests.
+        self.loop.run_until_complete(self.dataset_creation_async())
 
     async def dataset_1d_int_ts_wr_async(self):
         """
         Test a simple int 1-dimension timeseries write and read async worker
         """
         dsw = await self.dataset_creation_async()
-        t_prev = 0
+        t_prev = self.vbc.commitment_service.convert_timestamp_chain_to_str(0)
         for i in range(1, 5):
             # Commit an integer.
             cl, t_prev = await self._add_record_worker_async(self.vbc, dsw, i, t_prev)
             assert cl is not None
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
         dataset_from_json_checks(self.vbc, dsw)
 
     def test_dataset_1d_int_ts_wr_async(self):
         """
         Test a simple int 1-dimension timeseries write and read
         """
-        asyncio.run(self.dataset_1d_int_ts_wr_async())
+        self.loop.run_until_complete(self.dataset_1d_int_ts_wr_async())
 
 
 if __name__ == "__main__":
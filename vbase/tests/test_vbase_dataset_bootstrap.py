@@ -2,7 +2,6 @@
 Tests of the large dataset bootstrap for the vbase module
 """
 
-import time
 import unittest
 
 from vbase.core.vbase_client_test import VBaseClientTest
@@ -10,6 +9,7 @@ from vbase.core.vbase_object import VBasePortfolioObject
 from vbase.tests.utils import (
     create_dataset_worker,
     dataset_from_json_checks,
+    dataset_set_objects_checks,
 )
 
 
@@ -32,7 +32,7 @@ class TestVBaseDatasetBootstrap(unittest.TestCase):
 
         # Record 5 commitments over 5 blocks.
         # We should get a new block with each commitment due to automine.
-        # Sleep briefly to make sure timestamps don't collide.
+        # The timestamps are set explicitly, so they can't collide.
         cl = None
         for i in range(1, 6):
             # Commit a JSON object.
@@ -42,14 +42,8 @@ class TestVBaseDatasetBootstrap(unittest.TestCase):
             ts = self.vbc.commitment_service.convert_timestamp_chain_to_str(i)
             cl = dsw.add_record_with_timestamp(data, ts)
             assert self.vbc.verify_user_object(dsw.owner, cl["objectCid"], ts)
-            assert self.vbc.verify_user_set_objects(
-                dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-            )
+            dataset_set_objects_checks(self.vbc, dsw)
             assert cl["timestamp"] == ts
-            time.sleep(1)
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
-        )
 
         dataset_from_json_checks(self.vbc, dsw)
 
@@ -59,30 +53,26 @@ class TestVBaseDatasetBootstrap(unittest.TestCase):
         """
         dsw = create_dataset_worker(self.vbc, VBasePortfolioObject)
 
-        # Record 5 commitments over 5 blocks.
-        # We should get a new block with each commitment due to automine.
-        # Sleep briefly to make sure timestamps don't collide.
-        records = []
-        timestamps = []
-        for i in range(1, 6):
-            # Commit a JSON object.
-            records.append(
-                dict(zip(["AAA", "BBB", "CCC"], [0.2, 0.3 + i / 100, 0.5 - i / 100]))
-            )
-            # Use an internal function to quickly build timestamps.
-            # noinspection PyUnresolvedReferences
-            timestamps.append(
-                self.vbc.commitment_service.convert_timestamp_chain_to_str(i)
-            )
+        # Record 5 commitments with explicit timestamps in a single batch.
+        records = [
+            dict(zip(["AAA", "BBB", "CCC"], [0.2, 0.3 + i / 100, 0.5 - i / 100]))
+            for i in range(1, 6)
+        ]
+        # Use an internal function to quickly build timestamps.
+        # noinspection PyUnresolvedReferences
+        timestamps = self.vbc.commitment_service.convert_timestamps_chain_to_str(
+            range(1, 6)
+        )
         cl = dsw.add_records_with_timestamps_batch(records, timestamps)
         assert cl is not None
-        for i in range(0, 5):
-            assert self.vbc.verify_user_object(
-                dsw.owner, cl[i]["objectCid"], timestamps[i]
+        # The set check below does not cover timestamps,
+        # so verify the forced timestamps with a single batch call.
+        assert all(
+            self.vbc.verify_user_objects_batch(
+                dsw.owner, [cl[i]["objectCid"] for i in range(0, 5)], timestamps
             )
-        assert self.vbc.verify_user_set_objects(
-            dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum))
         )
+        dataset_set_objects_checks(self.vbc, dsw)
 
         dataset_from_json_checks(self.vbc, dsw)
 
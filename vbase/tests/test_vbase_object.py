@@ -0,0 +1,52 @@
+"""
+Test vBase object CID calculations
+"""
+
+import unittest
+
+from vbase.core.vbase_object import (
+    VBaseIntObject,
+    VBasePrivateIntObject,
+    VBaseFloatObject,
+    VBasePrivateFloatObject,
+    VBaseStringObject,
+    VBaseJsonObject,
+    VBasePortfolioObject,
+)
+
+
+# Record types and sample record data used to check batch CIDs.
+_CID_CASES = [
+    (VBaseIntObject, [0, 1, 42, 2**256 - 1]),
+    (VBasePrivateIntObject, [(0, "salt0"), (1, "salt1"), (42, "")]),
+    (VBaseFloatObject, [0.0, 1.5, -2.25, 1e6]),
+    (VBasePrivateFloatObject, [(0.0, "salt0"), (1.5, "salt1"), (-2.25, "")]),
+    (VBaseStringObject, ["", "Hello, world!", "é"]),
+    (VBaseJsonObject, ['{"a": 1}', '{"b": [1, 2]}']),
+    (VBasePortfolioObject, [{"A": 0.5, "B": -0.5}, {"C": 1}]),
+]
+
+
+class TestVBaseObject(unittest.TestCase):
+    """
+    Test vBase object CID calculations
+    """
+
+    def test_get_cids_for_data(self):
+        """
+        Test batch CIDs against per-record CIDs for all record types.
+        """
+        for record_type, record_data_list in _CID_CASES:
+            with self.subTest(record_type=record_type.__name__):
+                self.assertEqual(
+                    record_type.get_cids_for_data(record_data_list),
+                    [
+                        record_type.get_cid_for_data(record_data)
+                        for record_data in record_data_list
+                    ],
+                )
+                self.assertEqual(record_type.get_cids_for_data([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
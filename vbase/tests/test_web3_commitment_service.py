@@ -0,0 +1,75 @@
+"""
+Tests of the web3_commitment_service module that do not require a node
+"""
+
+import unittest
+import pandas as pd
+
+from vbase.core.web3_commitment_service import Web3CommitmentService
+
+
+class TestWeb3CommitmentService(unittest.TestCase):
+    """
+    Test Web3 commitment service helpers.
+    """
+
+    def test_convert_timestamp_str_to_chain(self):
+        """
+        Test conversion of timestamp strings to chain timestamps
+        against the pandas reference implementation.
+        """
+        for ts in [
+            "2023-01-01",
+            "2023-01-01 00:00:00",
+            "2023-01-01 12:34:56+00:00",
+            "2023-01-01 12:34:56.789+00:00",
+            "2023-01-01T12:34:56-05:00",
+            "2023/01/01",
+            "2023-01-01 12:34:56.123456789+00:00",
+        ]:
+            with self.subTest(ts=ts):
+                self.assertEqual(
+                    Web3CommitmentService.convert_timestamp_str_to_chain(ts),
+                    int(pd.Timestamp(ts).timestamp()),
+                )
+
+    def test_convert_timestamp_round_trip(self):
+        """
+        Test that chain timestamps survive a round trip through strings.
+        """
+        for ts in [0, 1, 1672531200, 1700000000]:
+            with self.subTest(ts=ts):
+                self.assertEqual(
+                    Web3CommitmentService.convert_timestamp_str_to_chain(
+                        Web3CommitmentService.convert_timestamp_chain_to_str(ts)
+                    ),
+                    ts,
+                )
+
+    def test_convert_timestamps_chain_to_str(self):
+        """
+        Test that the vectorized conversion matches the scalar conversion.
+        """
+        ts_list = [0, 1, 1672531200, 1700000000]
+        self.assertEqual(
+            Web3CommitmentService.convert_timestamps_chain_to_str(ts_list),
+            [
+                Web3CommitmentService.convert_timestamp_chain_to_str(ts)
+                for ts in ts_list
+            ],
+        )
+        self.assertEqual(Web3CommitmentService.convert_timestamps_chain_to_str([]), [])
+
+    def test_convert_timestamp_pd_timestamp_to_chain(self):
+        """
+        Test that pd.Timestamp objects are still accepted.
+        """
+        t = pd.Timestamp("2023-01-01", tz="UTC")
+        self.assertEqual(
+            Web3CommitmentService.convert_timestamp_str_to_chain(t),
+            int(t.timestamp()),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
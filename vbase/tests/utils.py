@@ -2,11 +2,12 @@
 vBase Test utils
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
 import pprint
 import time
-from typing import Type
+from typing import Any, Callable, List, Tuple, Type
 
 from vbase.core.vbase_client import VBaseClient
 from vbase.core.vbase_client_test import VBaseClientTest
@@ -22,6 +23,17 @@ _LOG.setLevel(logging.INFO)
 _LOCALHOST_RPC_ENDPOINT = "http://127.0.0.1:8545/"
 
 
+# Maximum wait, in seconds, for the next commitment timestamp.
+# Bounds the wait if the node's clock runs ahead of the local clock,
+# and matches the fixed sleep the wait replaced.
+_MAX_TIMESTAMP_WAIT = 2
+
+# Maximum number of concurrent verification calls issued by tests.
+# Verification calls are read-only RPCs that spend most of their time
+# waiting on the network, so threads overlap them well.
+_MAX_CONCURRENT_CALLS = 8
+
+
 def int_to_hash(n: int) -> str:
     """
     Convert an integer to a hash string.
@@ -29,7 +41,7 @@ def int_to_hash(n: int) -> str:
     :param n: The integer.
     :return: The resulting hash string.
     """
-    return "0x" + f"{n:X}".rjust(64, "0")
+    return f"0x{n:064X}"
 
 
 # Hash constants used in various tests.
@@ -37,6 +49,19 @@ TEST_HASH1 = int_to_hash(1)
 TEST_HASH2 = int_to_hash(100)
 
 
+def verify_concurrently(calls: List[Tuple[Callable[..., Any], tuple, Any]]):
+    """
+    Issue independent read-only verification calls concurrently
+    and check their results.
+
+    :param calls: A list of (function, arguments, expected result) tuples.
+    """
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_CALLS) as executor:
+        futures = [executor.submit(f, *args) for f, args, _ in calls]
+        for future, (f, args, expected) in zip(futures, calls):
+            assert future.result() == expected, f"{f.__name__}{args} != {expected}"
+
+
 def create_dataset_worker(
     vbc: VBaseClientTest,
     record_type: Type[VBaseObject],
@@ -62,6 +87,16 @@ def create_dataset_worker(
     return dsw
 
 
+def dataset_set_objects_checks(vbc: VBaseClient, dsw: VBaseDataset):
+    """
+    Common test code to verify the set commitment for all dataset records.
+
+    :param vbc: The vBase client object.
+    :param dsw: The vBase dataset object.
+    """
+    assert vbc.verify_user_set_objects(dsw.owner, dsw.cid, dsw.object_cid_sum_hex)
+
+
 def dataset_add_record_checks(
     vbc: VBaseClient, dsw: VBaseDataset, cl: dict, t_prev: str
 ):
@@ -73,16 +108,50 @@ def dataset_add_record_checks(
     :param cl: The commitment log received from the commitment call.
     :param t_prev: Time of the previous operation.
     """
-    _LOG.info("dataset_add_record_checks(): cl = %s", pprint.pformat(cl))
-    assert vbc.verify_user_object(dsw.owner, cl["objectCid"], cl["timestamp"])
-    assert vbc.verify_user_set_objects(dsw.owner, dsw.cid, str(hex(dsw.object_cid_sum)))
+    # Skip the pprint work if the record will not be logged.
+    if _LOG.isEnabledFor(logging.INFO):
+        _LOG.info("dataset_add_record_checks(): cl = %s", pprint.pformat(cl))
+    # The record and set checks are independent node calls.
+    verify_concurrently(
+        [
+            (
+                vbc.verify_user_object,
+                (dsw.owner, cl["objectCid"], cl["timestamp"]),
+                True,
+            ),
+            (
+                vbc.verify_user_set_objects,
+                (dsw.owner, dsw.cid, dsw.object_cid_sum_hex),
+                True,
+            ),
+        ]
+    )
     # Use an internal function to quickly build timestamps.
     # noinspection PyUnresolvedReferences
     assert (
         vbc.commitment_service.convert_timestamp_str_to_chain(cl["timestamp"])
         - vbc.commitment_service.convert_timestamp_str_to_chain(t_prev)
     ) >= 1
-    time.sleep(2)
+    wait_for_next_timestamp(vbc, cl["timestamp"])
+
+
+def wait_for_next_timestamp(vbc: VBaseClient, timestamp: str):
+    """
+    Wait until a new commitment will receive a later timestamp.
+
+    Sleeps only for the remainder of the second following the timestamp
+    rather than for a fixed interval.
+    The wait is capped in case the node's clock runs ahead of the local clock.
+
+    :param vbc: The vBase client object.
+    :param timestamp: The timestamp of the last commitment.
+    """
+    # Use an internal function to quickly convert the timestamp.
+    # noinspection PyUnresolvedReferences
+    t_next = vbc.commitment_service.convert_timestamp_str_to_chain(timestamp) + 1
+    delay = t_next - time.time()
+    if delay > 0:
+        time.sleep(min(delay, _MAX_TIMESTAMP_WAIT))
 
 
 def dataset_from_json_checks(vbc: VBaseClient, dsw: VBaseDataset, verbose: bool = True):
@@ -95,7 +164,7 @@ def dataset_from_json_checks(vbc: VBaseClient, dsw: VBaseDataset, verbose: bool
     """
     # Create the string descriptor of the written dataset.
     str_dataset_json = dsw.to_json()
-    if verbose:
+    if verbose and _LOG.isEnabledFor(logging.INFO):
         _LOG.info(
             "str_dataset_json = %s",
             pprint.pformat(json.loads(str_dataset_json)).rstrip(),
@@ -117,4 +186,6 @@ def compare_dict_subset(superset_dict: dict, subset_dict: dict):
     :param superset_dict: The superset dictionary.
     :param subset_dict: The subset dictionary.
     """
-    return {k: superset_dict[k] for k in subset_dict.keys()} == subset_dict
+    return all(
+        k in superset_dict and superset_dict[k] == v for k, v in subset_dict.items()
+    )
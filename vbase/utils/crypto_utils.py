@@ -2,13 +2,11 @@
 Common cryptographic utility functions
 """
 
-from typing import Any, List, Union
+import functools
+from typing import Any, Callable, Iterable, List, Sequence, Union
 import hashlib
-from eth_typing import (
-    HexStr,
-)
+import re
 from eth_utils import (
-    add_0x_prefix,
     remove_0x_prefix,
 )
 from web3._utils.encoding import (
@@ -22,12 +20,24 @@ from web3 import Web3
 # We represent negative value x as p - x.
 # Define p for the ALT_BN128 curve supported by Ethereum.
 FIELD_P = 21888242871839275222246405745257275088548364400416034343698204186575808495617
+# Field elements above this value represent negative values.
+_FIELD_P_HALF = FIELD_P >> 1
 
 # Fixed point base used to represent fractions
 # ZK proofs operate on uints, so fractions must be converted to uints.
 DECIMALS = 9
 DECIMALS_BASE = int(1e9)
 
+# Mask used to wrap uint256 arithmetic around on overflow.
+_UINT256_MASK = (1 << 256) - 1
+
+# Matches sized uint ABI types and captures the bit size.
+# A bare "uint" is left to the generic Web3 path, which rejects it.
+_UINT_TYPE_RE = re.compile(r"uint(\d+)")
+
+# Chunk size, in characters, used to encode and hash long strings incrementally.
+_STR_HASH_CHUNK_SIZE = 1 << 20
+
 
 def solidity_hash_typed_values(abi_types: List[str], values: List[Any]) -> str:
     """
@@ -62,16 +72,94 @@ def convert_typed_values_to_bytes(abi_types: List[str], values: List[Any]) -> by
             "Length mismatch between provided abi types and values.  Got "
             f"{len(abi_types)} types and {len(values)} values."
         )
+    # Write the bytes for each value directly
+    # rather than building and parsing an intermediate hex string.
+    return b"".join(
+        _get_abi_encoder(abi_type)(value) for abi_type, value in zip(abi_types, values)
+    )
 
-    normalized_values = Web3.normalize_values(None, abi_types, values)
 
-    hex_string = HexStr(
-        "".join(
-            remove_0x_prefix(hex_encode_abi_type(abi_type, value))
-            for abi_type, value in zip(abi_types, normalized_values)
-        )
+def _encode_abi_value(abi_type: str, value: Any) -> bytes:
+    """
+    Marshall a single value of an ABI type as Solidity does
+    using the generic Web3 marshalling.
+
+    :param abi_type: The Solidity ABI type.
+    :param value: The value to marshall.
+    :return: The resulting bytes.
+    """
+    normalized_value = Web3.normalize_values(None, [abi_type], [value])[0]
+    return bytes.fromhex(
+        remove_0x_prefix(hex_encode_abi_type(abi_type, normalized_value))
     )
-    return bytes.fromhex(hex_string)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_abi_encoder(abi_type: str) -> Callable[[Any], bytes]:
+    """
+    Return a function marshalling values of an ABI type as Solidity does.
+    Common types get fast encoders that write bytes directly.
+    Other types and unexpected values use the generic Web3 marshalling
+    that also validates the values.
+
+    :param abi_type: The Solidity ABI type.
+    :return: The encoder function taking a value and returning bytes.
+    """
+    if abi_type == "string":
+
+        def encode_string(value: Any) -> bytes:
+            if not isinstance(value, str):
+                return _encode_abi_value(abi_type, value)
+            return value.encode("utf-8")
+
+        return encode_string
+
+    match = _UINT_TYPE_RE.fullmatch(abi_type)
+    if match is not None:
+        n_bits = int(match.group(1))
+        if 0 < n_bits <= 256 and n_bits % 8 == 0:
+            n_bytes = n_bits // 8
+            limit = 1 << n_bits
+
+            def encode_uint(value: Any) -> bytes:
+                # bool is an int subclass but is not a valid uint value.
+                if (
+                    isinstance(value, bool)
+                    or not isinstance(value, int)
+                    or not 0 <= value < limit
+                ):
+                    return _encode_abi_value(abi_type, value)
+                return value.to_bytes(n_bytes, byteorder="big")
+
+            return encode_uint
+
+    return functools.partial(_encode_abi_value, abi_type)
+
+
+def hash_typed_values_batch(
+    abi_types: List[str], values_list: Iterable[Sequence[Any]]
+) -> List[str]:
+    """
+    Calculates sha3-256 hashes for a batch of rows of values
+    with the same ABI types.
+    Produces the same hashes as calling hash_typed_values() for each row,
+    but resolves the marshalling for the ABI types once for the batch.
+
+    :param abi_types: A list of Solidity ABI types.
+    :param values_list: The rows of values to hash.
+    :return: The resulting hashes.
+    """
+    encoders = [_get_abi_encoder(abi_type) for abi_type in abi_types]
+    hashes = []
+    for values in values_list:
+        if len(values) != len(encoders):
+            raise ValueError(
+                "Length mismatch between provided abi types and values.  Got "
+                f"{len(encoders)} types and {len(values)} values."
+            )
+        data_bytes = b"".join(encode(value) for encode, value in zip(encoders, values))
+        hashes.append("0x" + hashlib.sha3_256(data_bytes).hexdigest())
+    return hashes
 
 
 def hash_typed_values(abi_types: List[str], values: List[Any]) -> str:
@@ -84,9 +172,24 @@ def hash_typed_values(abi_types: List[str], values: List[Any]) -> str:
     :return: The resulting hash.
     """
     data_bytes = convert_typed_values_to_bytes(abi_types, values)
+    # hexdigest() never carries a 0x prefix.
+    return "0x" + hashlib.sha3_256(data_bytes).hexdigest()
+
+
+def hash_string(s: str) -> str:
+    """
+    Calculates a sha3-256 hash of a string marshalled as Solidity does.
+    Produces the same hash as hash_typed_values(["string"], [s]).
+    Encodes and hashes the string in chunks to avoid materializing
+    the complete marshalled representation, which matters for large strings.
+
+    :param s: The string to hash.
+    :return: The resulting hash.
+    """
     hash_obj = hashlib.sha3_256()
-    hash_obj.update(data_bytes)
-    return add_0x_prefix(str(hash_obj.hexdigest()))
+    for i in range(0, len(s), _STR_HASH_CHUNK_SIZE):
+        hash_obj.update(s[i : i + _STR_HASH_CHUNK_SIZE].encode("utf-8"))
+    return "0x" + hash_obj.hexdigest()
 
 
 def bytes_to_hex_str(byte_arr: bytes) -> str:
@@ -122,10 +225,12 @@ def hex_str_to_bytes(hex_str: str) -> bytes:
     """
     Convert a hex string to a byte array.
 
-    :param hex_str: The hex string to convert.
+    :param hex_str: The hex string to convert, with or without the 0x prefix.
     :return: The resulting byte array.
     """
-    return bytes.fromhex(hex_str[2:])
+    if hex_str[:2] in ("0x", "0X"):
+        hex_str = hex_str[2:]
+    return bytes.fromhex(hex_str)
 
 
 def hex_str_to_int(hex_str: str) -> int:
@@ -138,6 +243,21 @@ def hex_str_to_int(hex_str: str) -> int:
     return int(hex_str, 16)
 
 
+def add_uint256_uint256_int(n1: int, n2: int) -> int:
+    """
+    Add two uint256 integers with overflow and wrap-around.
+    This replicates the following sol code:
+    unchecked {
+        userSetObjectCidSums[userSetCid] += uint256(objectCid);
+    }
+
+    :param n1: The first integer.
+    :param n2: The second integer.
+    :returns: The resulting uint256 sum.
+    """
+    return (n1 + n2) & _UINT256_MASK
+
+
 def add_int_uint256(n1: int, n2_hex_str: str) -> int:
     """
     Add int and uint256 with overflow and wrap-around.
@@ -150,7 +270,7 @@ def add_int_uint256(n1: int, n2_hex_str: str) -> int:
     :param n2_hex_str: The second integer, passed as a hex string.
     :returns: The resulting uint256 sum.
     """
-    return (n1 + int(n2_hex_str, 16)) % (2**256)
+    return add_uint256_uint256_int(n1, int(n2_hex_str, 16))
 
 
 def add_uint256_uint256(n1_hex_str: str, n2_hex_str: str) -> str:
@@ -165,12 +285,27 @@ def add_uint256_uint256(n1_hex_str: str, n2_hex_str: str) -> str:
     :param n2_hex_str: The second integer, passed as a hex string.
     :returns: The resulting uint256 sum,
     """
-    return hex((int(n1_hex_str, 16) + int(n2_hex_str, 16)) % (2**256))
+    return hex(add_uint256_uint256_int(int(n1_hex_str, 16), int(n2_hex_str, 16)))
+
+
+def sum_uint256(hex_strs: Iterable[str]) -> int:
+    """
+    Sum uint256 integers with overflow and wrap-around.
+    Equivalent to accumulating the values with add_int_uint256(),
+    but wraps the sum around once at the end.
+
+    :param hex_strs: The integers to sum, passed as hex strings.
+    :returns: The resulting uint256 sum.
+    """
+    return sum(int(hex_str, 16) for hex_str in hex_strs) & _UINT256_MASK
 
 
+@functools.lru_cache(maxsize=4096)
 def string_to_u64_id(s: str) -> int:
     """
     Convert a string to an u64 id used in commitments.
+    Results are cached since the same ids, such as portfolio symbols,
+    are converted repeatedly.
 
     :param s: The string to convert.
     :returns: The u64 integer used in commitments.
@@ -204,7 +339,7 @@ def field_to_float(x: int) -> float:
     :return: The resulting float.
     """
     assert x < FIELD_P
-    if x > FIELD_P / 2:
+    if x > _FIELD_P_HALF:
         # Handle negative values.
-        return -(FIELD_P - x) / DECIMALS_BASE
+        x -= FIELD_P
     return x / DECIMALS_BASE
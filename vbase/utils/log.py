@@ -3,11 +3,18 @@ Default logging interface
 """
 
 import logging
-
-
-_LOG_FORMATTER = logging.Formatter(
-    "[%(asctime)s][%(threadName)s][%(levelname)s]:%(message)s"
-)
+import os
+
+
+# Setting VBASE_FAST_LOG=1 omits timestamps from log records.
+# This avoids time formatting on every record for high-volume logging,
+# such as long test runs.
+if os.environ.get("VBASE_FAST_LOG") == "1":
+    _LOG_FORMATTER = logging.Formatter("[%(threadName)s][%(levelname)s]:%(message)s")
+else:
+    _LOG_FORMATTER = logging.Formatter(
+        "[%(asctime)s][%(threadName)s][%(levelname)s]:%(message)s"
+    )
 
 
 def get_default_logger(name: str) -> logging.Logger: